@@ -12,7 +12,11 @@ Notes:
 
 import os
 import sys
-import datetime
+import time
+import functools
+import contextlib
+from dataclasses import dataclass
+from html import escape as _html_escape
 
 # -------------------- CONFIGURATION --------------------
 # Thresholds for evaluation (fixed values)
@@ -25,6 +29,10 @@ THRESHOLDS = {
     "Latency (us)": 5000.0,
 }
 
+# Fixed display order for metrics in the reports (alphabetical).
+# Every result's metric_status has exactly the THRESHOLDS keys.
+_METRIC_ORDER = tuple(sorted(THRESHOLDS))
+
 # Status color mapping
 STATUS_COLORS = {
     "PASS": "#10b981",  # green
@@ -33,6 +41,11 @@ STATUS_COLORS = {
     "MIXED": "#f59e0b"  # amber
 }
 
+# Internal status codes. Evaluation and counting work on these small ints;
+# they are turned back into names via _STATUS_NAMES only when rendering.
+PASS, FAIL, SKIP, MIXED = range(4)
+_STATUS_NAMES = ("PASS", "FAIL", "SKIP", "MIXED")
+
 # GitHub Pages base URL (absolute). Override with env var if needed.
 SITE_BASE_URL = os.environ.get("SITE_BASE_URL", "https://luckyjoy.github.io/firmware_monitor/")
 if not SITE_BASE_URL.endswith("/"):
@@ -40,126 +53,251 @@ if not SITE_BASE_URL.endswith("/"):
 
 LATEST_URL = SITE_BASE_URL
 HISTORY_URL = SITE_BASE_URL + "report_history/"
+# SITE_BASE_URL comes from the environment, so the nav bar uses attribute-escaped copies.
+_LATEST_HREF = _html_escape(LATEST_URL)
+_HISTORY_HREF = _html_escape(HISTORY_URL)
+
+# Report files are written through a 1 MiB buffer so a whole report is
+# flushed in a handful of write() calls instead of one per 8 KiB.
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Flags for the temp file behind each report. O_EXCL makes the name ours alone;
+# O_BINARY (Windows only) leaves newline translation to the text layer.
+_TMP_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
 
 # -------------------- DATASET: FIXED DUMMY DATA --------------------
-MOCK_LOG_DATA = [
-    {
-        "scenario": "Low Load Boot",
-        "metrics": {
-            "Boot Timestamps": {"min": 100, "max": 3000, "avg": 1550},
-            "CPU (%)": {"min": 4.8, "max": 6.1, "avg": 5.37},
-            "Memory (KB)": {"min": 200, "max": 205, "avg": 202.5},
-            "Power (mW)": {"min": 14, "max": 15, "avg": 14.5},
-            "Temperature (°C)": {"min": 35.5, "max": 36.1, "avg": 35.8},
-            "Latency (us)": {"min": 250, "max": 250, "avg": 250},
-        }
-    },
-    {
-        "scenario": "High Load Boot",
-        "metrics": {
-            "Boot Timestamps": {"min": 50, "max": 2100, "avg": 1075},
-            "CPU (%)": {"min": 15.0, "max": 25.5, "avg": 20.2},
-            "Memory (KB)": {"min": 350, "max": 380, "avg": 365},
-            "Power (mW)": {"min": 35, "max": 35, "avg": 35},
-            "Temperature (°C)": {"min": 45.0, "max": 50.0, "avg": 47.5},
-            "Latency (us)": {"min": 550, "max": 950, "avg": 750},
-        }
-    },
-    {
-        "scenario": "Power Dip",
-        "metrics": {
-            "Power (mW)": {"min": 18, "max": 25, "avg": 21},
-            "Boot Timestamps": {"min": 100, "max": 7500, "avg": 3800},
-            "CPU (%)": {"min": 5.0, "max": 15.0, "avg": 10},
+# __slots__ is spelled out rather than using dataclass(slots=True), which
+# needs Python 3.10; fields have no defaults, so the two do not clash.
+@dataclass(frozen=True)
+class MetricStats:
+    __slots__ = ("min", "max", "avg")
+    min: float
+    max: float
+    avg: float
+
+
+@dataclass(frozen=True)
+class Scenario:
+    __slots__ = ("name", "metrics")
+    name: str
+    metrics: dict  # metric name -> MetricStats; missing metrics are SKIPped
+
+
+MOCK_LOG_DATA = (
+    Scenario(
+        name="Low Load Boot",
+        metrics={
+            "Boot Timestamps": MetricStats(100, 3000, 1550),
+            "CPU (%)": MetricStats(4.8, 6.1, 5.37),
+            "Memory (KB)": MetricStats(200, 205, 202.5),
+            "Power (mW)": MetricStats(14, 15, 14.5),
+            "Temperature (°C)": MetricStats(35.5, 36.1, 35.8),
+            "Latency (us)": MetricStats(250, 250, 250),
+        },
+    ),
+    Scenario(
+        name="High Load Boot",
+        metrics={
+            "Boot Timestamps": MetricStats(50, 2100, 1075),
+            "CPU (%)": MetricStats(15.0, 25.5, 20.2),
+            "Memory (KB)": MetricStats(350, 380, 365),
+            "Power (mW)": MetricStats(35, 35, 35),
+            "Temperature (°C)": MetricStats(45.0, 50.0, 47.5),
+            "Latency (us)": MetricStats(550, 950, 750),
+        },
+    ),
+    Scenario(
+        name="Power Dip",
+        metrics={
+            "Power (mW)": MetricStats(18, 25, 21),
+            "Boot Timestamps": MetricStats(100, 7500, 3800),
+            "CPU (%)": MetricStats(5.0, 15.0, 10),
             # Memory (KB) is missing -> Auto SKIP
-            "Temperature (°C)": {"min": 35.0, "max": 38.0, "avg": 36.5},
-            "Latency (us)": {"min": 400, "max": 400, "avg": 400},
-        }
-    },
-    {
-        "scenario": "Resource Contention",
-        "metrics": {
-            "Boot Timestamps": {"min": 100, "max": 4500, "avg": 2300},
-            "CPU (%)": {"min": 8.0, "max": 95.0, "avg": 50.75},
-            "Power (mW)": {"min": 20, "max": 150, "avg": 65},
-            "Temperature (°C)": {"min": 38.0, "max": 99.0, "avg": 60.67},
-            "Memory (KB)": {"min": 300, "max": 950, "avg": 625},
-            "Latency (us)": {"min": 7500, "max": 7500, "avg": 7500},
-        }
-    },
-    {
-        "scenario": "Thermal Stress",
-        "metrics": {
-            "Boot Timestamps": {"min": 500, "max": 7000, "avg": 4000},
-            "CPU (%)": {"min": 10, "max": 90, "avg": 60},
-            "Memory (KB)": {"min": 600, "max": 950, "avg": 800},
-            "Power (mW)": {"min": 50, "max": 120, "avg": 90},
-            "Temperature (°C)": {"min": 60, "max": 100, "avg": 90},
-            "Latency (us)": {"min": 1000, "max": 6000, "avg": 4000},
-        }
-    },
-    {
-        "scenario": "Recovery",
-        "metrics": {
-            "Boot Timestamps": {"min": 100, "max": 5000, "avg": 3000},
-            "CPU (%)": {"min": 2, "max": 15, "avg": 8},
+            "Temperature (°C)": MetricStats(35.0, 38.0, 36.5),
+            "Latency (us)": MetricStats(400, 400, 400),
+        },
+    ),
+    Scenario(
+        name="Resource Contention",
+        metrics={
+            "Boot Timestamps": MetricStats(100, 4500, 2300),
+            "CPU (%)": MetricStats(8.0, 95.0, 50.75),
+            "Power (mW)": MetricStats(20, 150, 65),
+            "Temperature (°C)": MetricStats(38.0, 99.0, 60.67),
+            "Memory (KB)": MetricStats(300, 950, 625),
+            "Latency (us)": MetricStats(7500, 7500, 7500),
+        },
+    ),
+    Scenario(
+        name="Thermal Stress",
+        metrics={
+            "Boot Timestamps": MetricStats(500, 7000, 4000),
+            "CPU (%)": MetricStats(10, 90, 60),
+            "Memory (KB)": MetricStats(600, 950, 800),
+            "Power (mW)": MetricStats(50, 120, 90),
+            "Temperature (°C)": MetricStats(60, 100, 90),
+            "Latency (us)": MetricStats(1000, 6000, 4000),
+        },
+    ),
+    Scenario(
+        name="Recovery",
+        metrics={
+            "Boot Timestamps": MetricStats(100, 5000, 3000),
+            "CPU (%)": MetricStats(2, 15, 8),
             # Memory (KB) missing -> auto SKIP
-            "Power (mW)": {"min": 15, "max": 40, "avg": 20},
-            "Temperature (°C)": {"min": 30, "max": 40, "avg": 35},
-            "Latency (us)": {"min": 500, "max": 2000, "avg": 1200},
-        }
-    }
-]
+            "Power (mW)": MetricStats(15, 40, 20),
+            "Temperature (°C)": MetricStats(30, 40, 35),
+            "Latency (us)": MetricStats(500, 2000, 1200),
+        },
+    ),
+)
 
 # -------------------- EVALUATION FUNCTIONS --------------------
 def evaluate_metric(metric_name, values, thresholds):
-    if not values or "avg" not in values:
-        return "SKIP"
-    avg_val = values["avg"]
-    if metric_name in thresholds:
-        return "PASS" if avg_val <= thresholds[metric_name] else "FAIL"
-    return "SKIP"
+    # A metric that was not reported, or has no threshold, is skipped.
+    limit = thresholds.get(metric_name)
+    if values is None or limit is None:
+        return SKIP
+    return PASS if values.avg <= limit else FAIL
 
 
 def evaluate_scenario(scenario_data, thresholds):
     results = {}
-    found_fail, found_pass, found_skip = False, False, False
+    seen = [False, False, False]  # indexed by PASS / FAIL / SKIP
 
-    for metric_name in thresholds.keys():
-        if metric_name in scenario_data["metrics"]:
-            values = scenario_data["metrics"][metric_name]
-            status = evaluate_metric(metric_name, values, thresholds)
-        else:
-            status = "SKIP"
+    get_values = scenario_data.metrics.get
+    for metric_name in thresholds:
+        status = evaluate_metric(metric_name, get_values(metric_name), thresholds)
         results[metric_name] = status
+        seen[status] = True
 
-        if status == "FAIL":
-            found_fail = True
-        elif status == "PASS":
-            found_pass = True
-        elif status == "SKIP":
-            found_skip = True
-
+    found_pass, found_fail, found_skip = seen
     if found_fail and found_pass:
-        scenario_status = "MIXED"
+        scenario_status = MIXED
     elif found_fail:
-        scenario_status = "FAIL"
+        scenario_status = FAIL
     elif found_pass and found_skip:
-        scenario_status = "MIXED"
+        scenario_status = MIXED
     elif found_pass:
-        scenario_status = "PASS"
+        scenario_status = PASS
     else:
-        scenario_status = "SKIP"
+        scenario_status = SKIP
 
     return results, scenario_status
 
 
+# Scenario and metric names are escaped before they are interpolated into HTML.
+# They come from a small closed set and repeat across every scenario, so the
+# escaped form is memoized. One-off values (build number, timestamp, history
+# file names) call _html_escape directly instead of filling this cache.
+@functools.lru_cache(maxsize=256)
+def _esc(text):
+    return _html_escape(str(text), quote=False)
+
+
 def render_status_label(status):
     color = STATUS_COLORS.get(status, "#000000")
     return f'<span style="color:{color}; font-weight:bold;">{status}</span>'
 
 
+# Only four statuses exist, so their labels are rendered once at import and
+# looked up per cell (indexed by status code) instead of re-formatted.
+_STATUS_LABEL_HTML = tuple(render_status_label(name) for name in _STATUS_NAMES)
+
+# Closing block of a scenario card (metric group end + colored status box),
+# likewise fixed per scenario status.
+_SCENARIO_STATUS_HTML = tuple(
+    f'</div><div class="test-result" style="border-left: 4px solid {STATUS_COLORS[name]}; background:#f9fafb; padding:8px; margin-top:10px;">'
+    f'Scenario Status: {_STATUS_LABEL_HTML[code]}</div></div>'
+    for code, name in enumerate(_STATUS_NAMES)
+)
+
+
 # -------------------- REPORT GENERATION --------------------
+# Static document shell for the HTML report. Built once at import; only the
+# nav bar, header lines, scenario cards and summaries are formatted per report.
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>Firmware Analysis Report</title>
+  <style>
+  body {
+    font-family: 'Inter', system-ui, -apple-system, Segoe UI, Roboto, sans-serif;
+    background-color: #f0f4f8; color: #1a202c; padding: 20px; margin: 0; line-height: 1.5;
+  }
+  .container {
+    max-width: 1200px; margin: 0 auto; background-color: #ffffff; padding: 20px;
+    box-shadow: 0 4px 12px rgba(0,0,0,0.1); border-radius: 12px;
+  }
+  h1 {
+    color: #1d4ed8; border-bottom: 3px solid #bfdbfe; padding-bottom: 10px; margin-bottom: 20px; font-size: 2em;
+  }
+  .author-info { color: #4b5563; font-size: 0.9em; margin-bottom: 5px; }
+  .nav-bar {
+    display: flex; justify-content: flex-start; margin-bottom: 20px; border-bottom: 1px solid #d1d5db; padding-bottom: 10px;
+  }
+  .nav-link {
+    text-decoration: none; color: #1d4ed8; font-weight: 600; padding: 5px 15px; margin-right: 10px;
+    border: 1px solid #bfdbfe; border-radius: 6px; transition: background-color 0.2s;
+  }
+  .nav-link:hover { background-color: #eff6ff; }
+  .nav-link-history { background-color: #dbeafe; }
+  .report-grid { display: grid; grid-template-columns: 1fr; gap: 20px; margin-top: 15px; }
+  @media (min-width: 768px) { .report-grid { grid-template-columns: 1fr 1fr; } }
+  .scenario-card { background-color: #f9fafb; border: 1px solid #e5e7eb; padding: 15px; border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,0.05); }
+  .scenario-card h3 { color: #059669; font-size: 1.4em; margin: 0 0 10px 0; border-bottom: 2px solid #a7f3d0; padding-bottom: 5px; }
+  .metric-group { display: grid; grid-template-columns: 1fr; gap: 10px; margin-bottom: 15px; }
+  @media (min-width: 640px) { .metric-group { grid-template-columns: 1fr 1fr; } }
+  @media (min-width: 1024px) { .metric-group { grid-template-columns: 1fr 1fr 1fr; } }
+  .metric-item {
+    display: flex; justify-content: space-between; align-items: center; background-color: #ffffff;
+    padding: 8px 12px; border-radius: 6px; border-left: 4px solid #fcd34d; font-size: 0.9em; box-shadow: 0 1px 2px rgba(0,0,0,0.03);
+  }
+  .metric-key { color: #4b5563; font-weight: 500; }
+  .metric-value { color: #1f2937; font-weight: 700; text-align: right; }
+  .summary-card { background-color: #dbeafe; border: 2px solid #93c5fd; padding: 20px; margin-top: 30px; border-radius: 10px; }
+  .summary-card h2 { color: #1e3a8a; font-size: 1.8em; margin: 0 0 15px 0; text-align: center; }
+  .summary-item { display: flex; justify-content: space-between; padding: 5px 0; border-bottom: 1px dotted #93c5fd; }
+  .summary-key { font-weight: 600; color: #1f2937; }
+  .summary-value { font-weight: 700; }
+  </style>
+</head>
+<body>
+  <div class="container">
+    <h1>Firmware Performance Analysis Comprehensive Report</h1>
+    """
+
+_HTML_TAIL = """
+  </div>
+</body>
+</html>"""
+
+
+@contextlib.contextmanager
+def _atomic_report_file(path):
+    """Yields a buffered text file that replaces `path` atomically once the block succeeds."""
+    # The temp file lives next to the target so os.replace() stays a same-volume
+    # rename; the .tmp suffix keeps a crash leftover out of the *.html globs.
+    # Mode 0666 lets the kernel apply the current umask, exactly as open() would.
+    while True:
+        tmp_path = f"{path}.{os.urandom(4).hex()}.tmp"
+        try:
+            fd = os.open(tmp_path, _TMP_OPEN_FLAGS, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
 class FirmwarePerformanceAnalyzer:
     # ADDED is_merge_run parameter to control report generation flow
     def __init__(self, build_number=None, is_merge_run=False):
@@ -167,25 +305,43 @@ class FirmwarePerformanceAnalyzer:
         self.build_number = build_number if build_number else "NA"
         self.scenarios = MOCK_LOG_DATA
         self.results = []
+        self.suite_counts = [0] * len(_STATUS_NAMES)   # suites per scenario status code
+        self.metric_counts = [0] * len(_STATUS_NAMES)  # individual tests per status code
         self.is_merge_run = is_merge_run # NEW: controls unique vs. merge report generation
 
     def analyze(self):
+        """Evaluates every scenario and tallies the summary counts in the same pass.
+
+        Each result is a flat tuple (scenario_name, rows, scenario_status), where
+        rows holds one (metric, min, max, avg, status) tuple per metric in
+        _METRIC_ORDER; min/max/avg are None when the metric was not reported.
+        Statuses are PASS/FAIL/SKIP/MIXED codes (see _STATUS_NAMES).
+        """
+        suite_counts, metric_counts = self.suite_counts, self.metric_counts
         for scenario in self.scenarios:
             metrics_status, scenario_status = evaluate_scenario(scenario, THRESHOLDS)
-            self.results.append({
-                "scenario": scenario["scenario"],
-                "metrics": scenario["metrics"],
-                "metric_status": metrics_status,
-                "scenario_status": scenario_status
-            })
+            metrics = scenario.metrics
+            rows = []
+            for metric in _METRIC_ORDER:
+                status = metrics_status[metric]
+                metric_counts[status] += 1
+                values = metrics.get(metric)
+                if values is None:
+                    rows.append((metric, None, None, None, status))
+                else:
+                    rows.append((metric, values.min, values.max, values.avg, status))
+            self.results.append((scenario.name, tuple(rows), scenario_status))
+            suite_counts[scenario_status] += 1
 
     def generate_reports(self):
         report_dir = os.path.join(os.getcwd(), "reports")
         os.makedirs(report_dir, exist_ok=True)
 
-        # Generate timestamps
-        timestamp_raw = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        timestamp_human = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S Local Time") # Local Time
+        # Generate timestamps from a single clock read so the file name
+        # and the report header always agree.
+        now = time.localtime()
+        timestamp_raw = time.strftime("%Y%m%d_%H%M%S", now)
+        timestamp_human = time.strftime("%Y-%m-%d %H:%M:%S Local Time", now) # Local Time
 
         # 1. Generate the fixed-name merge reports (used in 'deploy' job)
         if self.is_merge_run:
@@ -201,11 +357,9 @@ class FirmwarePerformanceAnalyzer:
             txt_path = os.path.join(report_dir, base_filename + ".txt")
             html_path = os.path.join(report_dir, base_filename + ".html")
 
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(self.generate_text_report(timestamp_raw, timestamp_human))
-
-            with open(html_path, "w", encoding="utf-8") as f:
-                f.write(self.generate_html_report(timestamp_raw, timestamp_human))
+            # Both reports are written side by side in one pass over the results.
+            with _atomic_report_file(txt_path) as txt_f, _atomic_report_file(html_path) as html_f:
+                self._emit_reports(timestamp_human, txt_out=txt_f, html_out=html_f)
 
             print(f"Reports generated:\n- {txt_path}\n- {html_path}")
 
@@ -216,14 +370,14 @@ class FirmwarePerformanceAnalyzer:
         
         # 1. Generate the main report (report.html)
         main_html_path = os.path.join(report_dir, "report.html")
-        with open(main_html_path, "w", encoding="utf-8") as f:
-            f.write(self.generate_html_report(timestamp_raw, timestamp_human))
+        with _atomic_report_file(main_html_path) as f:
+            self.generate_html_report(timestamp_raw, timestamp_human, f)
         print(f"Generated: {main_html_path}")
 
         # 2. Generate the history list page (report_history.html)
         history_html_path = os.path.join(report_dir, "report_history.html")
         history_content = self._generate_history_html(report_dir)
-        with open(history_html_path, "w", encoding="utf-8") as f:
+        with _atomic_report_file(history_html_path) as f:
             f.write(history_content)
         print(f"Generated: {history_html_path}")
 
@@ -245,7 +399,7 @@ class FirmwarePerformanceAnalyzer:
             # Extract timestamp/info for display
             display_name = filename.replace("firmware_analysis_report_", "").replace(".html", "")
             
-            list_items.append(f'<li><a href="./{link_path}">{display_name}</a></li>')
+            list_items.append(f'<li><a href="./{_html_escape(link_path)}">{_html_escape(display_name, quote=False)}</a></li>')
 
         history_list = "\n".join(list_items)
         
@@ -265,213 +419,109 @@ class FirmwarePerformanceAnalyzer:
         return history_html
 
 
-    def generate_text_report(self, timestamp_raw, timestamp_human):
-        lines = []
-        lines.append("Firmware Performance Analysis Report")
-        lines.append(f"Author: Bang Thien Nguyen <ontario1998@gmail.com>")
-        lines.append(f"Build Number: {self.build_number}")
-        lines.append(f"Test Run Timestamp: {timestamp_human}")
-        lines.append("=" * 60)
-
-        for result in self.results:
-            lines.append(f"\nScenario: {result['scenario']}")
-            for metric, status in sorted(result["metric_status"].items()):
-                values = result["metrics"].get(metric)
-                if values:
-                    lines.append(
-                        f" {metric}: Min={values['min']} "
-                        f"Max={values['max']} "
-                        f"Avg={values['avg']} -> {status}"
-                    )
+    def generate_text_report(self, timestamp_raw, timestamp_human, out):
+        """Writes the TXT report to the open text stream `out`."""
+        self._emit_reports(timestamp_human, txt_out=out)
+
+    def generate_html_report(self, timestamp_raw, timestamp_human, out):
+        """Writes the HTML report to the open text stream `out`."""
+        self._emit_reports(timestamp_human, html_out=out)
+
+    def _emit_reports(self, timestamp_human, txt_out=None, html_out=None):
+        """Writes the TXT and/or HTML report in a single pass over self.results."""
+        txt = txt_out.write if txt_out is not None else None
+        html = html_out.write if html_out is not None else None
+        # Hot-loop lookups bound to locals.
+        esc, names, labels, footers = _esc, _STATUS_NAMES, _STATUS_LABEL_HTML, _SCENARIO_STATUS_HTML
+
+        if txt:
+            txt("Firmware Performance Analysis Report\n")
+            txt(f"Author: Bang Thien Nguyen <ontario1998@gmail.com>\n")
+            txt(f"Build Number: {self.build_number}\n")
+            txt(f"Test Run Timestamp: {timestamp_human}\n")
+            txt("=" * 60 + "\n")
+
+        if html:
+            author_line = f"<div class='author-info'>Author: Bang Thien Nguyen &lt;<a href='mailto:ontario1998@gmail.com'>ontario1998@gmail.com</a>&gt;</div>"
+
+            # Use human-readable timestamp here
+            build_line = f"<div class='author-info'>Build Number: {_html_escape(str(self.build_number), quote=False)} &nbsp;|&nbsp; Test Run Timestamp: {_html_escape(timestamp_human, quote=False)}</div>"
+
+            html(_HTML_HEAD)
+            html(
+                f'<div class="nav-bar"><a class="nav-link" href="{_LATEST_HREF}">Latest Report</a>'
+                f'<a class="nav-link nav-link-history" href="{_HISTORY_HREF}">Report History</a></div>'
+                f'{author_line}{build_line}<div class="report-grid">'
+            )
+
+        for scenario_name, rows, scenario_status in self.results:
+            if txt:
+                txt(f"\nScenario: {scenario_name}\n")
+            if html:
+                html(f'<div class="scenario-card"><h3>{esc(scenario_name)}</h3><div class="metric-group">')
+
+            for metric, mn, mx, av, status in rows:
+                if av is not None:
+                    if txt:
+                        txt(f" {metric}: Min={mn} Max={mx} Avg={av} -> {names[status]}\n")
+                    if html:
+                        html(
+                            f'<div class="metric-item"><span class="metric-key">{esc(metric)}</span>'
+                            f'<span class="metric-value">Min: {mn} &nbsp; Max: {mx} &nbsp; '
+                            f'Avg: {av} → {labels[status]}</span></div>'
+                        )
                 else:
-                    lines.append(f" {metric}: Not available -> {status}")
-
-            lines.append(f"Scenario Status: {result['scenario_status']}")
-            lines.append("-" * 40)
-
-        suite_pass, suite_fail, suite_mixed, suite_skip = self._get_suite_summary_counts()
+                    if txt:
+                        txt(f" {metric}: Not available -> {names[status]}\n")
+                    if html:
+                        html(
+                            f'<div class="metric-item"><span class="metric-key">{esc(metric)}</span>'
+                            f'<span class="metric-value">Not available → {labels[status]}</span></div>'
+                        )
+
+            if txt:
+                txt(f"Scenario Status: {names[scenario_status]}\n")
+                txt("-" * 40 + "\n")
+            if html:
+                html(footers[scenario_status])
+
+        suite_counts, metric_counts = self.suite_counts, self.metric_counts
+        suite_pass, suite_fail = suite_counts[PASS], suite_counts[FAIL]
+        suite_mixed, suite_skip = suite_counts[MIXED], suite_counts[SKIP]
         total_suites = len(self.results)
         suite_pass_percent = (suite_pass / total_suites * 100) if total_suites > 0 else 0
-        lines.append("\nSUMMARY (Test Suites)")
-        lines.append(f"Total Test Suites: {total_suites}")
-        lines.append(f"PASS: {suite_pass} ({suite_pass_percent:.2f}%), FAIL: {suite_fail}, MIXED: {suite_mixed}, SKIP: {suite_skip}")
 
-        metric_pass, metric_fail, metric_skip = self._get_metric_summary_counts()
+        metric_pass, metric_fail, metric_skip = metric_counts[PASS], metric_counts[FAIL], metric_counts[SKIP]
         total_metrics = metric_pass + metric_fail + metric_skip
         metric_pass_percent = (metric_pass / total_metrics * 100) if total_metrics > 0 else 0
-        lines.append("\nSUMMARY (Individual Tests)")
-        lines.append(f"Total Individual Tests: {total_metrics}")
-        lines.append(f"PASS: {metric_pass} ({metric_pass_percent:.2f}%), FAIL: {metric_fail}, SKIP: {metric_skip}")
-
-        return "\n".join(lines)
-
 
-    def generate_html_report(self, timestamp_raw, timestamp_human):
-        author_line = f"<div class='author-info'>Author: Bang Thien Nguyen &lt;<a href='mailto:ontario1998@gmail.com'>ontario1998@gmail.com</a>&gt;</div>"
-        
-        # Use human-readable timestamp here
-        build_line = f"<div class='author-info'>Build Number: {self.build_number} &nbsp;|&nbsp; Test Run Timestamp: {timestamp_human}</div>" 
-
-        nav_bar = f"""
-        <div class="nav-bar">
-          <a class="nav-link" href="{LATEST_URL}">Latest Report</a>
-          <a class="nav-link nav-link-history" href="{HISTORY_URL}">Report History</a>
-        </div>
-        """
-        
-        scenario_html = ""
-        for result in self.results:
-            metric_html = ""
-            for metric, status in sorted(result["metric_status"].items()):
-                values = result["metrics"].get(metric)
-                status_label = render_status_label(status)
-                if values:
-                    metric_html += f"""
-                    <div class="metric-item">
-                      <span class="metric-key">{metric}</span>
-                      <span class="metric-value">Min: {values['min']} &nbsp; Max: {values['max']} &nbsp; Avg: {values['avg']} → {status_label}</span>
-                    </div>
-                    """
-                else:
-                    metric_html += f"""
-                    <div class="metric-item">
-                      <span class="metric-key">{metric}</span>
-                      <span class="metric-value">Not available → {status_label}</span>
-                    </div>
-                    """
-
-            status_color = STATUS_COLORS.get(result['scenario_status'], '#000')
-            scenario_status_label = render_status_label(result['scenario_status'])
-            scenario_html += f"""
-            <div class="scenario-card">
-              <h3>{result['scenario']}</h3>
-              <div class="metric-group">
-                {metric_html}
-              </div>
-              <div class="test-result" style="border-left: 4px solid {status_color}; background:#f9fafb; padding:8px; margin-top:10px;">
-                Scenario Status: {scenario_status_label}
-              </div>
-            </div>
-            """
-
-        suite_pass, suite_fail, suite_mixed, suite_skip = self._get_suite_summary_counts()
-        total_suites = len(self.results)
-        suite_pass_percent = (suite_pass / total_suites * 100) if total_suites > 0 else 0
-        suite_summary_html = f"""
-        <div class="summary-card">
-          <h2>Overall Summary (Test Suites)</h2>
-          <div class="summary-item"><span class="summary-key">Total Test Suites</span><span class="summary-value">{total_suites}</span></div>
-          <div class="summary-item"><span class="summary-key">PASS</span><span class="summary-value" style="color:{STATUS_COLORS['PASS']};">{suite_pass} ({suite_pass_percent:.2f}%)</span></div>
-          <div class="summary-item"><span class="summary-key">FAIL</span><span class="summary-value" style="color:{STATUS_COLORS['FAIL']};">{suite_fail}</span></div>
-          <div class="summary-item"><span class="summary-key">MIXED</span><span class="summary-value" style="color:{STATUS_COLORS['MIXED']};">{suite_mixed}</span></div>
-          <div class="summary-item"><span class="summary-key">SKIP</span><span class="summary-value" style="color:{STATUS_COLORS['SKIP']};">{suite_skip}</span></div>
-        </div>
-        """
-
-        metric_pass, metric_fail, metric_skip = self._get_metric_summary_counts()
-        total_metrics = metric_pass + metric_fail + metric_skip
-        metric_pass_percent = (metric_pass / total_metrics * 100) if total_metrics > 0 else 0
-        metric_summary_html = f"""
-        <div class="summary-card" style="background-color: #e0f2fe; border-color: #7dd3fc; margin-top: 20px;">
-          <h2>Overall Summary (Individual Tests)</h2>
-          <div class="summary-item"><span class="summary-key">Total Individual Tests</span><span class="summary-value">{total_metrics}</span></div>
-          <div class="summary-item"><span class="summary-key">PASS</span><span class="summary-value" style="color:{STATUS_COLORS['PASS']};">{metric_pass} ({metric_pass_percent:.2f}%)</span></div>
-          <div class="summary-item"><span class="summary-key">FAIL</span><span class="summary-value" style="color:{STATUS_COLORS['FAIL']};">{metric_fail}</span></div>
-          <div class="summary-item"><span class="summary-key">SKIP</span><span class="summary-value" style="color:{STATUS_COLORS['SKIP']};">{metric_skip}</span></div>
-        </div>
-        """
-
-        html_output = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Firmware Analysis Report</title>
-  <style>
-  body {{
-    font-family: 'Inter', system-ui, -apple-system, Segoe UI, Roboto, sans-serif;
-    background-color: #f0f4f8; color: #1a202c; padding: 20px; margin: 0; line-height: 1.5;
-  }}
-  .container {{
-    max-width: 1200px; margin: 0 auto; background-color: #ffffff; padding: 20px;
-    box-shadow: 0 4px 12px rgba(0,0,0,0.1); border-radius: 12px;
-  }}
-  h1 {{
-    color: #1d4ed8; border-bottom: 3px solid #bfdbfe; padding-bottom: 10px; margin-bottom: 20px; font-size: 2em;
-  }}
-  .author-info {{ color: #4b5563; font-size: 0.9em; margin-bottom: 5px; }}
-  .nav-bar {{
-    display: flex; justify-content: flex-start; margin-bottom: 20px; border-bottom: 1px solid #d1d5db; padding-bottom: 10px;
-  }}
-  .nav-link {{
-    text-decoration: none; color: #1d4ed8; font-weight: 600; padding: 5px 15px; margin-right: 10px;
-    border: 1px solid #bfdbfe; border-radius: 6px; transition: background-color 0.2s;
-  }}
-  .nav-link:hover {{ background-color: #eff6ff; }}
-  .nav-link-history {{ background-color: #dbeafe; }}
-  .report-grid {{ display: grid; grid-template-columns: 1fr; gap: 20px; margin-top: 15px; }}
-  @media (min-width: 768px) {{ .report-grid {{ grid-template-columns: 1fr 1fr; }} }}
-  .scenario-card {{ background-color: #f9fafb; border: 1px solid #e5e7eb; padding: 15px; border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,0.05); }}
-  .scenario-card h3 {{ color: #059669; font-size: 1.4em; margin: 0 0 10px 0; border-bottom: 2px solid #a7f3d0; padding-bottom: 5px; }}
-  .metric-group {{ display: grid; grid-template-columns: 1fr; gap: 10px; margin-bottom: 15px; }}
-  @media (min-width: 640px) {{ .metric-group {{ grid-template-columns: 1fr 1fr; }} }}
-  @media (min-width: 1024px) {{ .metric-group {{ grid-template-columns: 1fr 1fr 1fr; }} }}
-  .metric-item {{
-    display: flex; justify-content: space-between; align-items: center; background-color: #ffffff;
-    padding: 8px 12px; border-radius: 6px; border-left: 4px solid #fcd34d; font-size: 0.9em; box-shadow: 0 1px 2px rgba(0,0,0,0.03);
-  }}
-  .metric-key {{ color: #4b5563; font-weight: 500; }}
-  .metric-value {{ color: #1f2937; font-weight: 700; text-align: right; }}
-  .summary-card {{ background-color: #dbeafe; border: 2px solid #93c5fd; padding: 20px; margin-top: 30px; border-radius: 10px; }}
-  .summary-card h2 {{ color: #1e3a8a; font-size: 1.8em; margin: 0 0 15px 0; text-align: center; }}
-  .summary-item {{ display: flex; justify-content: space-between; padding: 5px 0; border-bottom: 1px dotted #93c5fd; }}
-  .summary-key {{ font-weight: 600; color: #1f2937; }}
-  .summary-value {{ font-weight: 700; }}
-  </style>
-</head>
-<body>
-  <div class="container">
-    <h1>Firmware Performance Analysis Comprehensive Report</h1>
-    {nav_bar}
-    {author_line}
-    {build_line}
-    <div class="report-grid">
-      {scenario_html}
-    </div>
-    {suite_summary_html}
-    {metric_summary_html}
-  </div>
-</body>
-</html>"""
-        return html_output
-
-    def _get_suite_summary_counts(self):
-        """Counts the final status for each test suite."""
-        pass_count = fail_count = mixed_count = skip_count = 0
-        for result in self.results:
-            status = result["scenario_status"]
-            if status == "PASS":
-                pass_count += 1
-            elif status == "FAIL":
-                fail_count += 1
-            elif status == "MIXED":
-                mixed_count += 1
-            elif status == "SKIP":
-                skip_count += 1
-        return pass_count, fail_count, mixed_count, skip_count
-
-    def _get_metric_summary_counts(self):
-        """Counts the status of all individual tests (metrics) across all suites."""
-        pass_count = fail_count = skip_count = 0
-        for result in self.results:
-            for status in result["metric_status"].values():
-                if status == "PASS":
-                    pass_count += 1
-                elif status == "FAIL":
-                    fail_count += 1
-                elif status == "SKIP":
-                    skip_count += 1
-        return pass_count, fail_count, skip_count
+        if txt:
+            txt("\nSUMMARY (Test Suites)\n")
+            txt(f"Total Test Suites: {total_suites}\n")
+            txt(f"PASS: {suite_pass} ({suite_pass_percent:.2f}%), FAIL: {suite_fail}, MIXED: {suite_mixed}, SKIP: {suite_skip}\n")
+            txt("\nSUMMARY (Individual Tests)\n")
+            txt(f"Total Individual Tests: {total_metrics}\n")
+            txt(f"PASS: {metric_pass} ({metric_pass_percent:.2f}%), FAIL: {metric_fail}, SKIP: {metric_skip}")
+
+        if html:
+            # Close the report grid, then the two summary cards.
+            html(
+                '</div><div class="summary-card"><h2>Overall Summary (Test Suites)</h2>'
+                f'<div class="summary-item"><span class="summary-key">Total Test Suites</span><span class="summary-value">{total_suites}</span></div>'
+                f'<div class="summary-item"><span class="summary-key">PASS</span><span class="summary-value" style="color:{STATUS_COLORS["PASS"]};">{suite_pass} ({suite_pass_percent:.2f}%)</span></div>'
+                f'<div class="summary-item"><span class="summary-key">FAIL</span><span class="summary-value" style="color:{STATUS_COLORS["FAIL"]};">{suite_fail}</span></div>'
+                f'<div class="summary-item"><span class="summary-key">MIXED</span><span class="summary-value" style="color:{STATUS_COLORS["MIXED"]};">{suite_mixed}</span></div>'
+                f'<div class="summary-item"><span class="summary-key">SKIP</span><span class="summary-value" style="color:{STATUS_COLORS["SKIP"]};">{suite_skip}</span></div>'
+                '</div>'
+                '<div class="summary-card" style="background-color: #e0f2fe; border-color: #7dd3fc; margin-top: 20px;">'
+                '<h2>Overall Summary (Individual Tests)</h2>'
+                f'<div class="summary-item"><span class="summary-key">Total Individual Tests</span><span class="summary-value">{total_metrics}</span></div>'
+                f'<div class="summary-item"><span class="summary-key">PASS</span><span class="summary-value" style="color:{STATUS_COLORS["PASS"]};">{metric_pass} ({metric_pass_percent:.2f}%)</span></div>'
+                f'<div class="summary-item"><span class="summary-key">FAIL</span><span class="summary-value" style="color:{STATUS_COLORS["FAIL"]};">{metric_fail}</span></div>'
+                f'<div class="summary-item"><span class="summary-key">SKIP</span><span class="summary-value" style="color:{STATUS_COLORS["SKIP"]};">{metric_skip}</span></div>'
+                '</div>'
+            )
+            html(_HTML_TAIL)
 
 
 # -------------------- MAIN ENTRY --------------------